@@ -59,7 +59,8 @@ func main() {
 	// Setup Gin router
 	gin.SetMode(gin.ReleaseMode)
 	router := gin.New()
-	router.Use(gin.Logger())
+	// Health probes poll every few seconds, so keep them out of the access log
+	router.Use(gin.LoggerWithConfig(gin.LoggerConfig{SkipPaths: []string{"/health"}}))
 	router.Use(gin.Recovery())
 	router.Use(handlers.CORSMiddleware())
 
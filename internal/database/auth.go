@@ -4,9 +4,33 @@ import (
 	"context"
 	"database/sql"
 	"fmt"
+	"sync"
 	"time"
 )
 
+// brokerConfigTTL bounds how long a cached broker config is served before
+// brokers.config is queried again
+const brokerConfigTTL = 30 * time.Second
+
+// brokerConfigEntry is a cached brokers.config row and when it was loaded
+type brokerConfigEntry struct {
+	config   BrokerConfig
+	loadedAt time.Time
+}
+
+// brokerConfigCache is a DB's in-process broker config cache keyed by broker
+// name. Every auth endpoint reads the config, while it only changes on
+// login/logout. brokers.config stays the shared source of truth for tokens,
+// so a token stored or cleared through another connection becomes visible
+// here within brokerConfigTTL. gen is bumped on every invalidation so a query
+// that started before a token update cannot store the stale row it read
+// afterwards.
+type brokerConfigCache struct {
+	mu      sync.RWMutex
+	entries map[string]brokerConfigEntry
+	gen     uint64
+}
+
 // BrokerConfig represents a row from brokers.config
 type BrokerConfig struct {
 	ID                  int        `json:"id"`
@@ -22,8 +46,26 @@ type BrokerConfig struct {
 	UpdatedAt           time.Time  `json:"updated_at"`
 }
 
+// InvalidateBrokerConfig drops the cached config for a broker so the next
+// GetBrokerConfig call reads it from the database
+func (db *DB) InvalidateBrokerConfig(brokerName string) {
+	db.brokerConfigs.mu.Lock()
+	delete(db.brokerConfigs.entries, brokerName)
+	db.brokerConfigs.gen++
+	db.brokerConfigs.mu.Unlock()
+}
+
 // GetBrokerConfig retrieves the active broker config for a given broker
 func (db *DB) GetBrokerConfig(ctx context.Context, brokerName string) (*BrokerConfig, error) {
+	db.brokerConfigs.mu.RLock()
+	entry, ok := db.brokerConfigs.entries[brokerName]
+	gen := db.brokerConfigs.gen
+	db.brokerConfigs.mu.RUnlock()
+	if ok && time.Since(entry.loadedAt) < brokerConfigTTL {
+		bc := entry.config
+		return &bc, nil
+	}
+
 	query := `
 		SELECT id, broker_name, enabled,
 		       COALESCE(api_key, ''), COALESCE(api_secret, ''),
@@ -51,6 +93,15 @@ func (db *DB) GetBrokerConfig(ctx context.Context, brokerName string) (*BrokerCo
 		return nil, fmt.Errorf("failed to get broker config: %w", err)
 	}
 
+	db.brokerConfigs.mu.Lock()
+	if db.brokerConfigs.gen == gen {
+		if db.brokerConfigs.entries == nil {
+			db.brokerConfigs.entries = map[string]brokerConfigEntry{}
+		}
+		db.brokerConfigs.entries[brokerName] = brokerConfigEntry{config: bc, loadedAt: time.Now()}
+	}
+	db.brokerConfigs.mu.Unlock()
+
 	return &bc, nil
 }
 
@@ -67,6 +118,7 @@ func (db *DB) UpdateBrokerToken(ctx context.Context, brokerName, accessToken, us
 	`
 
 	result, err := db.conn.ExecContext(ctx, query, accessToken, userID, expiresAt, brokerName)
+	db.InvalidateBrokerConfig(brokerName)
 	if err != nil {
 		return fmt.Errorf("failed to update broker token: %w", err)
 	}
@@ -89,6 +141,7 @@ func (db *DB) ClearBrokerToken(ctx context.Context, brokerName string) error {
 	`
 
 	_, err := db.conn.ExecContext(ctx, query, brokerName)
+	db.InvalidateBrokerConfig(brokerName)
 	if err != nil {
 		return fmt.Errorf("failed to clear broker token: %w", err)
 	}
@@ -13,6 +13,9 @@ import (
 
 type DB struct {
 	conn *sql.DB
+
+	// Broker configs read through this connection, see GetBrokerConfig
+	brokerConfigs brokerConfigCache
 }
 
 // GetConn returns the underlying database connection
@@ -80,9 +83,12 @@ func NewDB(dsn string) (*DB, error) {
 		return nil, fmt.Errorf("failed to open database: %w", err)
 	}
 
-	// Set connection pool settings
+	// Set connection pool settings. Keep as many idle connections as open ones
+	// so bursts reuse warm connections instead of paying a fresh TCP + auth
+	// handshake once more than a handful of requests run concurrently.
 	conn.SetMaxOpenConns(25)
-	conn.SetMaxIdleConns(5)
+	conn.SetMaxIdleConns(25)
+	conn.SetConnMaxIdleTime(2 * time.Minute)
 	conn.SetConnMaxLifetime(5 * time.Minute)
 
 	// Test connection
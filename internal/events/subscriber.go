@@ -1,18 +1,32 @@
 package events
 
 import (
-	"encoding/json"
 	"log"
+	"sync"
 	"time"
 
+	json "github.com/goccy/go-json"
 	"github.com/nats-io/nats.go"
 	"github.com/trading-chitti/core-api-go/internal/websocket"
 )
 
+// tickFlushInterval is the coalescing window for market ticks. Ticks arriving
+// within one window are conflated to the latest per symbol and broadcast
+// together, so the hub batches them into a single frame per client. Signal
+// events are not windowed and go out immediately.
+const tickFlushInterval = 100 * time.Millisecond
+
 // Subscriber subscribes to NATS events and broadcasts to WebSocket clients
 type Subscriber struct {
 	nc  *nats.Conn
 	hub *websocket.Hub
+
+	// Latest pending tick per symbol, flushed every tickFlushInterval
+	ticksMu sync.Mutex
+	ticks   map[string]TickEvent
+	done    chan struct{}
+
+	closeOnce sync.Once
 }
 
 // SignalEvent represents a signal event from NATS
@@ -64,11 +78,22 @@ func NewSubscriber(natsURL string, hub *websocket.Hub) (*Subscriber, error) {
 	}
 
 	log.Printf("✅ NATS subscriber connected: %s", natsURL)
-	return &Subscriber{nc: nc, hub: hub}, nil
+	return &Subscriber{
+		nc:    nc,
+		hub:   hub,
+		ticks: make(map[string]TickEvent),
+		done:  make(chan struct{}),
+	}, nil
 }
 
-// Close closes the NATS connection
+// Close closes the NATS connection and stops the tick flusher. Calls after
+// the first return immediately.
 func (s *Subscriber) Close() {
+	s.closeOnce.Do(s.close)
+}
+
+func (s *Subscriber) close() {
+	close(s.done)
 	if s.nc != nil {
 		s.nc.Close()
 		log.Println("👋 NATS subscriber disconnected")
@@ -88,7 +113,7 @@ func (s *Subscriber) Subscribe() error {
 		log.Printf("📥 Received signal.new: %s %s (%.2f confidence)", event.Symbol, event.SignalType, event.Confidence)
 
 		// Broadcast to WebSocket clients
-		s.hub.Broadcast(map[string]interface{}{
+		s.hub.BroadcastPriority(map[string]interface{}{
 			"type": "signal_new",
 			"data": event,
 		})
@@ -108,7 +133,7 @@ func (s *Subscriber) Subscribe() error {
 		log.Printf("📥 Received signal.updated: ID=%d Status=%s Price=%.2f", event.SignalID, event.Status, event.CurrentPrice)
 
 		// Broadcast to WebSocket clients
-		s.hub.Broadcast(map[string]interface{}{
+		s.hub.BroadcastPriority(map[string]interface{}{
 			"type": "signal_updated",
 			"data": event,
 		})
@@ -128,7 +153,7 @@ func (s *Subscriber) Subscribe() error {
 		log.Printf("📥 Received signal.closed: ID=%d Status=%s PNL=%.2f", event.SignalID, event.Status, event.PNL)
 
 		// Broadcast to WebSocket clients
-		s.hub.Broadcast(map[string]interface{}{
+		s.hub.BroadcastPriority(map[string]interface{}{
 			"type": "signal_closed",
 			"data": event,
 		})
@@ -145,20 +170,45 @@ func (s *Subscriber) Subscribe() error {
 			return
 		}
 
-		// Only broadcast every 5 seconds to avoid overwhelming clients
-		// (ticks are high frequency)
-		// In production, you'd add throttling logic here
-
-		// Broadcast to WebSocket clients
-		s.hub.Broadcast(map[string]interface{}{
-			"type": "market_tick",
-			"data": event,
-		})
+		// Ticks are high frequency, so only keep the latest per symbol
+		// until the next flush
+		s.ticksMu.Lock()
+		s.ticks[event.Symbol] = event
+		s.ticksMu.Unlock()
 	})
 	if err != nil {
 		return err
 	}
+	go s.flushTicks()
 
 	log.Println("✅ Subscribed to NATS subjects: signal.*, market.tick")
 	return nil
 }
+
+// flushTicks broadcasts the pending ticks to WebSocket clients once per
+// tickFlushInterval until the subscriber is closed
+func (s *Subscriber) flushTicks() {
+	ticker := time.NewTicker(tickFlushInterval)
+	defer ticker.Stop()
+
+	pending := make(map[string]TickEvent)
+	for {
+		select {
+		case <-s.done:
+			return
+		case <-ticker.C:
+		}
+
+		s.ticksMu.Lock()
+		s.ticks, pending = pending, s.ticks
+		s.ticksMu.Unlock()
+
+		for symbol, event := range pending {
+			s.hub.Broadcast(map[string]interface{}{
+				"type": "market_tick",
+				"data": event,
+			})
+			delete(pending, symbol)
+		}
+	}
+}
@@ -3,6 +3,7 @@ package handlers
 import (
 	"context"
 	"crypto/sha256"
+	"crypto/subtle"
 	"encoding/base64"
 	"encoding/json"
 	"fmt"
@@ -11,14 +12,74 @@ import (
 	"net/http"
 	"net/url"
 	"strings"
+	"sync"
 	"time"
 
 	"github.com/gin-gonic/gin"
+	"github.com/trading-chitti/core-api-go/internal/database"
 )
 
+// kiteHTTPClient is shared by all Kite API calls so token exchanges and
+// profile checks reuse keep-alive connections to api.kite.trade
+var kiteHTTPClient = &http.Client{
+	Timeout:   10 * time.Second,
+	Transport: newKiteTransport(),
+}
+
+// newKiteTransport gives Kite calls their own connection pool, so the warm
+// TLS connection to api.kite.trade is not evicted by other outbound traffic
+// and stays idle long enough to be reused between logins
+func newKiteTransport() *http.Transport {
+	t := http.DefaultTransport.(*http.Transport).Clone()
+	t.MaxIdleConnsPerHost = 4
+	t.IdleConnTimeout = 5 * time.Minute
+	return t
+}
+
+// istLocation is Asia/Kolkata, loaded once rather than read from the tz
+// database on every token request
+var istLocation = loadISTLocation()
+
+func loadISTLocation() *time.Location {
+	loc, err := time.LoadLocation("Asia/Kolkata")
+	if err != nil {
+		return time.FixedZone("IST", 5*60*60+30*60)
+	}
+	return loc
+}
+
+// Last computed Zerodha expiry, reused until that instant passes
+var (
+	zerodhaExpiry   time.Time
+	zerodhaExpiryMu sync.Mutex
+)
+
+// zerodhaTokenExpiry returns when a Zerodha token issued at now expires.
+// Tokens expire at 3:30 PM IST same day (generated after 12 AM IST), so the
+// answer only changes once a day and is cached until then.
+func zerodhaTokenExpiry(now time.Time) time.Time {
+	zerodhaExpiryMu.Lock()
+	defer zerodhaExpiryMu.Unlock()
+
+	if !now.After(zerodhaExpiry) && now.After(zerodhaExpiry.Add(-24*time.Hour)) {
+		return zerodhaExpiry
+	}
+
+	local := now.In(istLocation)
+	expiresAt := time.Date(local.Year(), local.Month(), local.Day(), 15, 30, 0, 0, istLocation)
+	if local.After(expiresAt) {
+		expiresAt = expiresAt.Add(24 * time.Hour)
+	}
+	zerodhaExpiry = expiresAt
+	return expiresAt
+}
+
+// kiteLoginURLPrefix is the Kite Connect login URL up to the api_key value
+const kiteLoginURLPrefix = "https://kite.zerodha.com/connect/login?v=3&api_key="
+
 // GetZerodhaLoginUrl returns the Zerodha Kite login URL with the configured API key
 func (h *Handler) GetZerodhaLoginUrl(c *gin.Context) {
-	ctx, cancel := context.WithTimeout(context.Background(), 5*time.Second)
+	ctx, cancel := context.WithTimeout(c.Request.Context(), 5*time.Second)
 	defer cancel()
 
 	config, err := h.db.GetBrokerConfig(ctx, "zerodha")
@@ -35,10 +96,8 @@ func (h *Handler) GetZerodhaLoginUrl(c *gin.Context) {
 		return
 	}
 
-	loginURL := fmt.Sprintf("https://kite.zerodha.com/connect/login?v=3&api_key=%s", config.APIKey)
-
 	c.JSON(http.StatusOK, gin.H{
-		"login_url": loginURL,
+		"login_url": kiteLoginURLPrefix + config.APIKey,
 		"api_key":   config.APIKey,
 	})
 }
@@ -88,8 +147,7 @@ func (h *Handler) ExchangeRequestToken(c *gin.Context) {
 	req.Header.Set("Content-Type", "application/x-www-form-urlencoded")
 	req.Header.Set("X-Kite-Version", "3")
 
-	client := &http.Client{Timeout: 10 * time.Second}
-	resp, err := client.Do(req)
+	resp, err := kiteHTTPClient.Do(req)
 	if err != nil {
 		log.Printf("Kite API error: %v", err)
 		c.JSON(http.StatusBadGateway, gin.H{"detail": fmt.Sprintf("Kite API error: %v", err)})
@@ -126,13 +184,7 @@ func (h *Handler) ExchangeRequestToken(c *gin.Context) {
 		return
 	}
 
-	// Zerodha tokens expire at 3:30 PM IST same day (generated after 12 AM IST)
-	ist, _ := time.LoadLocation("Asia/Kolkata")
-	now := time.Now().In(ist)
-	expiresAt := time.Date(now.Year(), now.Month(), now.Day(), 15, 30, 0, 0, ist)
-	if now.After(expiresAt) {
-		expiresAt = expiresAt.Add(24 * time.Hour)
-	}
+	expiresAt := zerodhaTokenExpiry(time.Now())
 
 	// Store token in database
 	if err := h.db.UpdateBrokerToken(ctx, "zerodha",
@@ -142,6 +194,7 @@ func (h *Handler) ExchangeRequestToken(c *gin.Context) {
 		return
 	}
 
+	saveZerodhaUserName(kiteResp.Data.AccessToken, kiteResp.Data.UserName)
 	log.Printf("✅ Zerodha token exchanged for user %s", kiteResp.Data.UserID)
 
 	c.JSON(http.StatusOK, gin.H{
@@ -174,20 +227,183 @@ func (h *Handler) SaveAccessToken(c *gin.Context) {
 		return
 	}
 
-	// Validate token by calling Kite profile API
+	// Re-posting the token that is already stored, enabled and unexpired is
+	// a no-op, so skip both the Kite round-trip and the database write. The
+	// cached config only nominates the shortcut; it is confirmed against a
+	// fresh read so a logout on another instance is not missed.
+	if userName, ok := savedZerodhaUserName(body.AccessToken); ok && storedTokenMatches(config, body.AccessToken, body.UserID) {
+		h.db.InvalidateBrokerConfig("zerodha")
+		config, err = h.db.GetBrokerConfig(ctx, "zerodha")
+		if err != nil || config == nil {
+			c.JSON(http.StatusInternalServerError, gin.H{"detail": "Broker config not found"})
+			return
+		}
+		if storedTokenMatches(config, body.AccessToken, body.UserID) {
+			c.JSON(http.StatusOK, gin.H{
+				"status":           "success",
+				"user_id":          config.UserID,
+				"user_name":        userName,
+				"token_expires_at": config.TokenExpiresAt.Format(time.RFC3339),
+				"authenticated":    true,
+			})
+			return
+		}
+	}
+
+	// Validate token by calling Kite profile API, unless it was validated recently
+	profile, ok := cachedKiteProfile(config.APIKey, body.AccessToken)
+	if !ok {
+		var status int
+		var failure gin.H
+		profile, status, failure = fetchKiteProfile(ctx, config.APIKey, body.AccessToken)
+		if failure != nil {
+			c.JSON(status, failure)
+			return
+		}
+		storeKiteProfile(config.APIKey, body.AccessToken, profile)
+	}
+
+	userID := profile.UserID
+	if body.UserID != "" {
+		userID = body.UserID
+	}
+
+	expiresAt := zerodhaTokenExpiry(time.Now())
+
+	if err := h.db.UpdateBrokerToken(ctx, "zerodha", body.AccessToken, userID, expiresAt); err != nil {
+		log.Printf("Failed to store token: %v", err)
+		c.JSON(http.StatusInternalServerError, gin.H{"detail": "Failed to store token"})
+		return
+	}
+
+	saveZerodhaUserName(body.AccessToken, profile.UserName)
+	log.Printf("✅ Zerodha access token saved for user %s", userID)
+
+	c.JSON(http.StatusOK, gin.H{
+		"status":           "success",
+		"user_id":          userID,
+		"user_name":        profile.UserName,
+		"token_expires_at": expiresAt.Format(time.RFC3339),
+		"authenticated":    true,
+	})
+}
+
+// storedTokenMatches reports whether config holds accessToken as an enabled,
+// unexpired token for userID (any user when userID is empty)
+func storedTokenMatches(config *database.BrokerConfig, accessToken, userID string) bool {
+	return config.Enabled &&
+		config.TokenExpiresAt != nil && time.Now().Before(*config.TokenExpiresAt) &&
+		(userID == "" || userID == config.UserID) &&
+		sameToken(accessToken, config.AccessToken)
+}
+
+// Digest of the Zerodha token this instance last stored and the Kite user
+// name it belongs to; brokers.config has no user name column, and it is all
+// a no-op SaveAccessToken response needs beyond the stored row
+var (
+	savedZerodhaDigest [sha256.Size]byte
+	savedZerodhaName   string
+	savedZerodhaMu     sync.Mutex
+)
+
+// saveZerodhaUserName records userName for a token just stored; an empty
+// token forgets the record
+func saveZerodhaUserName(accessToken, userName string) {
+	savedZerodhaMu.Lock()
+	defer savedZerodhaMu.Unlock()
+
+	if accessToken == "" {
+		savedZerodhaDigest, savedZerodhaName = [sha256.Size]byte{}, ""
+		return
+	}
+	savedZerodhaDigest = sha256.Sum256([]byte(accessToken))
+	savedZerodhaName = userName
+}
+
+// savedZerodhaUserName returns the user name recorded for accessToken, if it
+// is the token this instance last stored
+func savedZerodhaUserName(accessToken string) (string, bool) {
+	digest := sha256.Sum256([]byte(accessToken))
+
+	savedZerodhaMu.Lock()
+	defer savedZerodhaMu.Unlock()
+
+	if savedZerodhaName == "" || subtle.ConstantTimeCompare(digest[:], savedZerodhaDigest[:]) != 1 {
+		return "", false
+	}
+	return savedZerodhaName, true
+}
+
+// sameToken compares two access tokens by their SHA-256 digests in constant time
+func sameToken(a, b string) bool {
+	if a == "" || b == "" {
+		return false
+	}
+	ha := sha256.Sum256([]byte(a))
+	hb := sha256.Sum256([]byte(b))
+	return subtle.ConstantTimeCompare(ha[:], hb[:]) == 1
+}
+
+// kiteProfileTTL is how long a successful Kite profile validation of a token
+// is reused before api.kite.trade is asked again
+const kiteProfileTTL = 60 * time.Second
+
+// kiteProfile is the part of a Kite /user/profile response the API uses
+type kiteProfile struct {
+	UserID      string
+	UserName    string
+	validatedAt time.Time
+}
+
+// Recent successful profile validations keyed by api_key:access_token
+var (
+	kiteProfiles   = map[string]kiteProfile{}
+	kiteProfilesMu sync.Mutex
+)
+
+func cachedKiteProfile(apiKey, accessToken string) (kiteProfile, bool) {
+	kiteProfilesMu.Lock()
+	defer kiteProfilesMu.Unlock()
+
+	key := apiKey + ":" + accessToken
+	profile, ok := kiteProfiles[key]
+	if !ok {
+		return kiteProfile{}, false
+	}
+	if time.Since(profile.validatedAt) >= kiteProfileTTL {
+		delete(kiteProfiles, key)
+		return kiteProfile{}, false
+	}
+	return profile, true
+}
+
+func storeKiteProfile(apiKey, accessToken string, profile kiteProfile) {
+	profile.validatedAt = time.Now()
+	kiteProfilesMu.Lock()
+	kiteProfiles[apiKey+":"+accessToken] = profile
+	kiteProfilesMu.Unlock()
+}
+
+// clearKiteProfiles forgets every cached validation, e.g. on logout
+func clearKiteProfiles() {
+	kiteProfilesMu.Lock()
+	kiteProfiles = map[string]kiteProfile{}
+	kiteProfilesMu.Unlock()
+}
+
+// fetchKiteProfile validates an access token against the Kite profile API.
+// On failure it returns the HTTP status and body to send to the caller.
+func fetchKiteProfile(ctx context.Context, apiKey, accessToken string) (kiteProfile, int, gin.H) {
 	profileReq, err := http.NewRequestWithContext(ctx, "GET", "https://api.kite.trade/user/profile", nil)
 	if err != nil {
-		c.JSON(http.StatusInternalServerError, gin.H{"detail": "Failed to create validation request"})
-		return
+		return kiteProfile{}, http.StatusInternalServerError, gin.H{"detail": "Failed to create validation request"}
 	}
 	profileReq.Header.Set("X-Kite-Version", "3")
-	profileReq.Header.Set("Authorization", fmt.Sprintf("token %s:%s", config.APIKey, body.AccessToken))
+	profileReq.Header.Set("Authorization", fmt.Sprintf("token %s:%s", apiKey, accessToken))
 
-	client := &http.Client{Timeout: 10 * time.Second}
-	resp, err := client.Do(profileReq)
+	resp, err := kiteHTTPClient.Do(profileReq)
 	if err != nil {
-		c.JSON(http.StatusBadGateway, gin.H{"detail": fmt.Sprintf("Failed to validate token: %v", err)})
-		return
+		return kiteProfile{}, http.StatusBadGateway, gin.H{"detail": fmt.Sprintf("Failed to validate token: %v", err)}
 	}
 	defer resp.Body.Close()
 
@@ -204,56 +420,33 @@ func (h *Handler) SaveAccessToken(c *gin.Context) {
 	}
 
 	if err := json.Unmarshal(respBody, &profileResp); err != nil {
-		c.JSON(http.StatusBadGateway, gin.H{"detail": "Invalid response from Kite API"})
-		return
+		return kiteProfile{}, http.StatusBadGateway, gin.H{"detail": "Invalid response from Kite API"}
 	}
 
 	if profileResp.Status != "success" {
-		c.JSON(http.StatusBadRequest, gin.H{
+		return kiteProfile{}, http.StatusBadRequest, gin.H{
 			"detail":     fmt.Sprintf("Invalid token: %s", profileResp.Message),
 			"error_type": profileResp.ErrorType,
-		})
-		return
-	}
-
-	userID := profileResp.Data.UserID
-	if body.UserID != "" {
-		userID = body.UserID
-	}
-
-	// Zerodha tokens expire at 3:30 PM IST same day (generated after 12 AM IST)
-	ist, _ := time.LoadLocation("Asia/Kolkata")
-	now := time.Now().In(ist)
-	expiresAt := time.Date(now.Year(), now.Month(), now.Day(), 15, 30, 0, 0, ist)
-	if now.After(expiresAt) {
-		expiresAt = expiresAt.Add(24 * time.Hour)
-	}
-
-	if err := h.db.UpdateBrokerToken(ctx, "zerodha", body.AccessToken, userID, expiresAt); err != nil {
-		log.Printf("Failed to store token: %v", err)
-		c.JSON(http.StatusInternalServerError, gin.H{"detail": "Failed to store token"})
-		return
+		}
 	}
 
-	log.Printf("✅ Zerodha access token saved for user %s", userID)
-
-	c.JSON(http.StatusOK, gin.H{
-		"status":           "success",
-		"user_id":          userID,
-		"user_name":        profileResp.Data.UserName,
-		"token_expires_at": expiresAt.Format(time.RFC3339),
-		"authenticated":    true,
-	})
+	return kiteProfile{UserID: profileResp.Data.UserID, UserName: profileResp.Data.UserName}, 0, nil
 }
 
 // GetZerodhaAuthStatus returns the current Zerodha authentication status
 func (h *Handler) GetZerodhaAuthStatus(c *gin.Context) {
-	ctx, cancel := context.WithTimeout(context.Background(), 5*time.Second)
+	h.brokerAuthStatus(c, "zerodha")
+}
+
+// brokerAuthStatus writes the authentication status stored in
+// brokers.config for a broker
+func (h *Handler) brokerAuthStatus(c *gin.Context, brokerName string) {
+	ctx, cancel := context.WithTimeout(c.Request.Context(), 5*time.Second)
 	defer cancel()
 
-	config, err := h.db.GetBrokerConfig(ctx, "zerodha")
+	config, err := h.db.GetBrokerConfig(ctx, brokerName)
 	if err != nil {
-		log.Printf("Failed to get broker config: %v", err)
+		log.Printf("Failed to get %s broker config: %v", brokerName, err)
 		c.JSON(http.StatusInternalServerError, gin.H{"detail": "Failed to check auth status"})
 		return
 	}
@@ -304,6 +497,8 @@ func (h *Handler) LogoutZerodha(c *gin.Context) {
 		c.JSON(http.StatusInternalServerError, gin.H{"detail": "Failed to logout"})
 		return
 	}
+	clearKiteProfiles()
+	saveZerodhaUserName("", "")
 
 	log.Println("✅ Zerodha token cleared")
 
@@ -313,12 +508,18 @@ func (h *Handler) LogoutZerodha(c *gin.Context) {
 	})
 }
 
-// parseJWTExpiry extracts the "exp" claim from a JWT token without verifying the signature.
-// Returns the expiry time or a fallback if parsing fails.
-func parseJWTExpiry(token string, fallback time.Time) time.Time {
+// jwtClaims holds the JWT claims read from broker access tokens
+type jwtClaims struct {
+	Exp      int64  `json:"exp"`
+	ClientID string `json:"clientID"`
+}
+
+// decodeJWTClaims decodes the payload of a JWT token without verifying the
+// signature. It returns zero claims and false if any part fails to decode.
+func decodeJWTClaims(token string) (jwtClaims, bool) {
 	parts := strings.Split(token, ".")
 	if len(parts) != 3 {
-		return fallback
+		return jwtClaims{}, false
 	}
 
 	// Base64-decode the payload (second part), adding padding if needed
@@ -328,18 +529,14 @@ func parseJWTExpiry(token string, fallback time.Time) time.Time {
 	}
 	decoded, err := base64.URLEncoding.DecodeString(payload)
 	if err != nil {
-		return fallback
+		return jwtClaims{}, false
 	}
 
-	var claims struct {
-		Exp      int64  `json:"exp"`
-		ClientID string `json:"clientID"`
-	}
-	if err := json.Unmarshal(decoded, &claims); err != nil || claims.Exp == 0 {
-		return fallback
+	var claims jwtClaims
+	if err := json.Unmarshal(decoded, &claims); err != nil {
+		return jwtClaims{}, false
 	}
-
-	return time.Unix(claims.Exp, 0)
+	return claims, true
 }
 
 // SaveIndMoneyToken saves the IndMoney access token to the database
@@ -357,34 +554,19 @@ func (h *Handler) SaveIndMoneyToken(c *gin.Context) {
 	ctx, cancel := context.WithTimeout(context.Background(), 10*time.Second)
 	defer cancel()
 
-	// Try to extract expiry from JWT; fall back to next-day 7 AM IST
-	ist, _ := time.LoadLocation("Asia/Kolkata")
-	now := time.Now().In(ist)
-	fallbackExpiry := time.Date(now.Year(), now.Month(), now.Day()+1, 7, 0, 0, 0, ist)
-	expiresAt := parseJWTExpiry(body.AccessToken, fallbackExpiry)
-
-	userID := body.UserID
-	clientID := ""
-	// Try to extract clientID from JWT for user_id
-	parts := strings.Split(body.AccessToken, ".")
-	if len(parts) == 3 {
-		payload := parts[1]
-		if m := len(payload) % 4; m != 0 {
-			payload += strings.Repeat("=", 4-m)
-		}
-		if decoded, err := base64.URLEncoding.DecodeString(payload); err == nil {
-			var claims struct {
-				ClientID string `json:"clientID"`
-			}
-			if json.Unmarshal(decoded, &claims) == nil && claims.ClientID != "" {
-				clientID = claims.ClientID
-			}
-		}
+	// Try to extract expiry and clientID from the JWT; fall back to
+	// next-day 7 AM IST and a generic user id
+	now := time.Now().In(istLocation)
+	expiresAt := time.Date(now.Year(), now.Month(), now.Day()+1, 7, 0, 0, 0, istLocation)
+	claims, ok := decodeJWTClaims(body.AccessToken)
+	if ok && claims.Exp != 0 {
+		expiresAt = time.Unix(claims.Exp, 0)
 	}
 
+	userID := body.UserID
 	if userID == "" {
-		if clientID != "" {
-			userID = clientID
+		if ok && claims.ClientID != "" {
+			userID = claims.ClientID
 		} else {
 			userID = "indmoney_user"
 		}
@@ -409,50 +591,7 @@ func (h *Handler) SaveIndMoneyToken(c *gin.Context) {
 
 // GetIndMoneyAuthStatus returns the current IndMoney authentication status
 func (h *Handler) GetIndMoneyAuthStatus(c *gin.Context) {
-	ctx, cancel := context.WithTimeout(context.Background(), 5*time.Second)
-	defer cancel()
-
-	config, err := h.db.GetBrokerConfig(ctx, "indmoney")
-	if err != nil {
-		log.Printf("Failed to get IndMoney broker config: %v", err)
-		c.JSON(http.StatusInternalServerError, gin.H{"detail": "Failed to check auth status"})
-		return
-	}
-
-	if config == nil || config.AccessToken == "" {
-		c.JSON(http.StatusOK, gin.H{
-			"status":        "not_authenticated",
-			"authenticated": false,
-		})
-		return
-	}
-
-	isExpired := false
-	if config.TokenExpiresAt != nil {
-		isExpired = time.Now().After(*config.TokenExpiresAt)
-	}
-
-	status := "authenticated"
-	if isExpired {
-		status = "expired"
-	}
-
-	result := gin.H{
-		"status":        status,
-		"authenticated": config.Enabled && !isExpired,
-		"user_id":       config.UserID,
-		"enabled":       config.Enabled,
-		"is_expired":    isExpired,
-	}
-
-	if config.TokenExpiresAt != nil {
-		result["token_expires_at"] = config.TokenExpiresAt.Format(time.RFC3339)
-	}
-	if config.LastAuthenticatedAt != nil {
-		result["authenticated_at"] = config.LastAuthenticatedAt.Format(time.RFC3339)
-	}
-
-	c.JSON(http.StatusOK, result)
+	h.brokerAuthStatus(c, "indmoney")
 }
 
 // LogoutIndMoney logs out the user and invalidates the IndMoney token
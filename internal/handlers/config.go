@@ -12,35 +12,52 @@ import (
 	"github.com/gin-gonic/gin"
 )
 
-// GetSmartSelection handles GET /api/config/smart-selection
-func (h *Handler) GetSmartSelection(c *gin.Context) {
-	ctx, cancel := context.WithTimeout(context.Background(), 5*time.Second)
-	defer cancel()
+// smartSelectionConfig holds the smart stock selection settings from md.system_config
+type smartSelectionConfig struct {
+	Enabled    bool
+	StockCount int
+}
 
-	var configValue sql.NullString
-	err := h.db.GetConn().QueryRowContext(ctx,
-		"SELECT config_value FROM md.system_config WHERE config_key = 'smart_stock_selection_enabled'",
-	).Scan(&configValue)
+// loadSmartSelectionConfig reads every smart selection setting in one query
+func (h *Handler) loadSmartSelectionConfig(ctx context.Context) smartSelectionConfig {
+	cfg := smartSelectionConfig{StockCount: 200}
 
-	enabled := false
-	if err == nil && configValue.Valid {
-		enabled = configValue.String == "true"
+	rows, err := h.db.GetConn().QueryContext(ctx,
+		`SELECT config_key, config_value FROM md.system_config
+		WHERE config_key IN ('smart_stock_selection_enabled', 'smart_selection_stock_count')`,
+	)
+	if err != nil {
+		return cfg
+	}
+	defer rows.Close()
+
+	for rows.Next() {
+		var key string
+		var value sql.NullString
+		if err := rows.Scan(&key, &value); err != nil || !value.Valid {
+			continue
+		}
+		switch key {
+		case "smart_stock_selection_enabled":
+			cfg.Enabled = value.String == "true"
+		case "smart_selection_stock_count":
+			json.Unmarshal([]byte(value.String), &cfg.StockCount)
+		}
 	}
 
-	// Get stock count setting
-	var stockCount sql.NullString
-	err = h.db.GetConn().QueryRowContext(ctx,
-		"SELECT config_value FROM md.system_config WHERE config_key = 'smart_selection_stock_count'",
-	).Scan(&stockCount)
+	return cfg
+}
 
-	count := 200
-	if err == nil && stockCount.Valid {
-		json.Unmarshal([]byte(stockCount.String), &count)
-	}
+// GetSmartSelection handles GET /api/config/smart-selection
+func (h *Handler) GetSmartSelection(c *gin.Context) {
+	ctx, cancel := context.WithTimeout(context.Background(), 5*time.Second)
+	defer cancel()
+
+	cfg := h.loadSmartSelectionConfig(ctx)
 
 	c.JSON(http.StatusOK, gin.H{
-		"enabled":     enabled,
-		"stock_count": count,
+		"enabled":     cfg.Enabled,
+		"stock_count": cfg.StockCount,
 		"timestamp":   time.Now().Format(time.RFC3339),
 	})
 }
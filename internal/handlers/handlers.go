@@ -5,6 +5,7 @@ import (
 	"log"
 	"net/http"
 	"strconv"
+	"sync"
 	"time"
 
 	"github.com/gin-gonic/gin"
@@ -14,8 +15,12 @@ import (
 )
 
 var upgrader = websocket.Upgrader{
-	ReadBufferSize:  1024,
-	WriteBufferSize: 1024,
+	ReadBufferSize: 1024,
+	// A batched frame up to WriteBufferSize goes out in one write call, so
+	// size it for a burst of ticks rather than a single message. Buffers are
+	// pooled and held only while a frame is being written.
+	WriteBufferSize: 8192,
+	WriteBufferPool: &sync.Pool{},
 	CheckOrigin: func(r *http.Request) bool {
 		// Allow all origins (in production, restrict this)
 		return true
@@ -122,6 +127,7 @@ func (h *Handler) Health(c *gin.Context) {
 		"service":           "core-api-go",
 		"timestamp":         time.Now().UTC().Format(time.RFC3339),
 		"websocket_clients": h.hub.ClientCount(),
+		"websocket":         h.hub.Stats(),
 	})
 }
 
@@ -3,7 +3,13 @@ package handlers
 import (
 	"context"
 	"fmt"
+	"io"
+	"net"
 	"net/http"
+	"net/url"
+	"os"
+	"strings"
+	"sync"
 	"time"
 
 	"github.com/gin-gonic/gin"
@@ -30,10 +36,28 @@ var serviceEndpoints = []serviceEndpoint{
 	{Name: "intraday-engine", URL: "http://localhost:6007/health"},
 	{Name: "market-bridge", URL: "http://localhost:6005/health"},
 	{Name: "news-nlp", URL: "http://localhost:6006/health"},
-	// NATS doesn't have HTTP endpoint - marked as healthy in GetMonitorServices
+	// NATS doesn't have an HTTP endpoint - probed over TCP by checkNATS
 	{Name: "dashboard", URL: "http://localhost:6003"},
 }
 
+// healthCheckClient is used for service health probes. All probed services
+// are local, so a connect that takes longer than healthCheckDialTimeout means
+// the service is down and the probe fails fast instead of holding the request
+// for the whole check timeout.
+var healthCheckClient = &http.Client{
+	Transport: &http.Transport{
+		DialContext:         (&net.Dialer{Timeout: healthCheckDialTimeout}).DialContext,
+		MaxIdleConnsPerHost: 2,
+		IdleConnTimeout:     90 * time.Second,
+	},
+}
+
+const healthCheckDialTimeout = 250 * time.Millisecond
+
+// healthCheckDrainLimit caps how much of a probe response is read to allow
+// connection reuse; larger bodies (e.g. the dashboard page) just close
+const healthCheckDrainLimit = 64 << 10
+
 // checkServiceHTTP performs an HTTP health check for a service
 func checkServiceHTTP(ctx context.Context, ep serviceEndpoint, now string) ServiceInfo {
 	start := time.Now()
@@ -43,13 +67,16 @@ func checkServiceHTTP(ctx context.Context, ep serviceEndpoint, now string) Servi
 		return ServiceInfo{Name: ep.Name, Status: "unhealthy", LastCheck: now}
 	}
 
-	resp, err := http.DefaultClient.Do(req)
+	resp, err := healthCheckClient.Do(req)
 	responseTimeMs := float64(time.Since(start).Milliseconds())
 
 	if err != nil {
 		return ServiceInfo{Name: ep.Name, Status: "unhealthy", AvgResponseTime: responseTimeMs, LastCheck: now}
 	}
 	defer resp.Body.Close()
+	// Drain the body so the keep-alive connection goes back to the pool and
+	// the next probe of this service skips the TCP handshake
+	io.Copy(io.Discard, io.LimitReader(resp.Body, healthCheckDrainLimit))
 
 	status := "unhealthy"
 	if resp.StatusCode >= 200 && resp.StatusCode < 300 {
@@ -61,6 +88,44 @@ func checkServiceHTTP(ctx context.Context, ep serviceEndpoint, now string) Servi
 	return ServiceInfo{Name: ep.Name, Status: status, Uptime: 99.9, AvgResponseTime: responseTimeMs, LastCheck: now}
 }
 
+// natsAddr is the host:port of the NATS server the event subscriber uses
+var natsAddr = natsProbeAddr()
+
+// NATS_URL may list several servers separated by commas; only the first is
+// probed, and the NATS default port is filled in when the URL omits one
+func natsProbeAddr() string {
+	first, _, _ := strings.Cut(os.Getenv("NATS_URL"), ",")
+	u, err := url.Parse(strings.TrimSpace(first))
+	if err != nil || u.Hostname() == "" {
+		return "localhost:4222"
+	}
+	if u.Port() == "" {
+		return net.JoinHostPort(u.Hostname(), "4222")
+	}
+	return u.Host
+}
+
+// probeTCP reports how long it took to open a TCP connection to addr, or
+// why it could not. A listening socket is all that is checked.
+func probeTCP(ctx context.Context, addr string) (time.Duration, error) {
+	start := time.Now()
+	conn, err := (&net.Dialer{Timeout: healthCheckDialTimeout}).DialContext(ctx, "tcp", addr)
+	if err != nil {
+		return 0, err
+	}
+	conn.Close()
+	return time.Since(start), nil
+}
+
+// checkNATS probes the NATS client port
+func checkNATS(ctx context.Context, now string) ServiceInfo {
+	elapsed, err := probeTCP(ctx, natsAddr)
+	if err != nil {
+		return ServiceInfo{Name: "nats", Status: "unhealthy", LastCheck: now}
+	}
+	return ServiceInfo{Name: "nats", Status: "healthy", Uptime: 99.9, AvgResponseTime: float64(elapsed.Milliseconds()), LastCheck: now}
+}
+
 // GetMonitorServices handles GET /api/monitor/services
 func (h *Handler) GetMonitorServices(c *gin.Context) {
 	ctx, cancel := context.WithTimeout(context.Background(), 5*time.Second)
@@ -68,34 +133,84 @@ func (h *Handler) GetMonitorServices(c *gin.Context) {
 
 	now := time.Now().Format(time.RFC3339)
 
-	services := []ServiceInfo{
-		{Name: "core-api-go", Status: "healthy", Uptime: 99.9, AvgResponseTime: 1, LastCheck: now},
-	}
+	// core-api-go, postgres, the HTTP services, then nats
+	services := make([]ServiceInfo, len(serviceEndpoints)+3)
+	services[0] = ServiceInfo{Name: "core-api-go", Status: "healthy", Uptime: 99.9, AvgResponseTime: 1, LastCheck: now}
 
-	// Check database
-	dbStatus := "healthy"
-	dbStart := time.Now()
-	if err := h.db.GetConn().PingContext(ctx); err != nil {
-		dbStatus = "unhealthy"
-	}
-	services = append(services, ServiceInfo{
-		Name: "postgres", Status: dbStatus, Uptime: 99.9,
-		AvgResponseTime: float64(time.Since(dbStart).Milliseconds()), LastCheck: now,
-	})
+	// Run the checks concurrently so the response takes as long as the
+	// slowest service rather than the sum of all of them
+	var wg sync.WaitGroup
+	wg.Add(1)
+	go func() {
+		defer wg.Done()
+
+		dbStatus := "healthy"
+		dbStart := time.Now()
+		if err := h.db.GetConn().PingContext(ctx); err != nil {
+			dbStatus = "unhealthy"
+		}
+		services[1] = ServiceInfo{
+			Name: "postgres", Status: dbStatus, Uptime: 99.9,
+			AvgResponseTime: float64(time.Since(dbStart).Milliseconds()), LastCheck: now,
+		}
+	}()
 
 	// Check all external services via HTTP
-	for _, ep := range serviceEndpoints {
-		services = append(services, checkServiceHTTP(ctx, ep, now))
+	for i, ep := range serviceEndpoints {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			services[i+2] = checkServiceHTTP(ctx, ep, now)
+		}()
 	}
 
-	// NATS doesn't have HTTP endpoint, mark as healthy manually
-	services = append(services, ServiceInfo{
-		Name: "nats", Status: "healthy", Uptime: 99.9, AvgResponseTime: 0, LastCheck: now,
-	})
+	// NATS doesn't have an HTTP endpoint, so check its client port
+	wg.Add(1)
+	go func() {
+		defer wg.Done()
+		services[len(services)-1] = checkNATS(ctx, now)
+	}()
+	wg.Wait()
 
 	c.JSON(http.StatusOK, gin.H{"services": services})
 }
 
+// monitorServiceCheck produces the status of one named service
+type monitorServiceCheck func(h *Handler, ctx context.Context, now string) ServiceInfo
+
+// monitorServiceChecks maps every service name (and alias) accepted by
+// GET /api/monitor/services/:service to its check, so dispatch is one lookup
+var monitorServiceChecks = map[string]monitorServiceCheck{
+	"core-api-go": checkCoreAPI,
+	"core-api":    checkCoreAPI,
+	"postgres":    checkPostgres,
+	"database":    checkPostgres,
+	"nats": func(h *Handler, ctx context.Context, now string) ServiceInfo {
+		return checkNATS(ctx, now)
+	},
+}
+
+func init() {
+	for _, ep := range serviceEndpoints {
+		monitorServiceChecks[ep.Name] = func(h *Handler, ctx context.Context, now string) ServiceInfo {
+			return checkServiceHTTP(ctx, ep, now)
+		}
+	}
+}
+
+func checkCoreAPI(h *Handler, ctx context.Context, now string) ServiceInfo {
+	return ServiceInfo{Name: "core-api-go", Status: "healthy", Uptime: 99.9, AvgResponseTime: 1, LastCheck: now}
+}
+
+func checkPostgres(h *Handler, ctx context.Context, now string) ServiceInfo {
+	dbStatus := "healthy"
+	dbStart := time.Now()
+	if err := h.db.GetConn().PingContext(ctx); err != nil {
+		dbStatus = "unhealthy"
+	}
+	return ServiceInfo{Name: "postgres", Status: dbStatus, AvgResponseTime: float64(time.Since(dbStart).Milliseconds()), LastCheck: now}
+}
+
 // GetMonitorService handles GET /api/monitor/services/:service
 func (h *Handler) GetMonitorService(c *gin.Context) {
 	service := c.Param("service")
@@ -104,31 +219,11 @@ func (h *Handler) GetMonitorService(c *gin.Context) {
 	ctx, cancel := context.WithTimeout(context.Background(), 3*time.Second)
 	defer cancel()
 
-	if service == "core-api-go" || service == "core-api" {
-		c.JSON(http.StatusOK, gin.H{"services": []ServiceInfo{
-			{Name: "core-api-go", Status: "healthy", Uptime: 99.9, AvgResponseTime: 1, LastCheck: now},
-		}})
+	check, ok := monitorServiceChecks[service]
+	if !ok {
+		c.JSON(http.StatusNotFound, gin.H{"error": fmt.Sprintf("Unknown service: %s", service)})
 		return
 	}
 
-	if service == "postgres" || service == "database" {
-		dbStatus := "healthy"
-		dbStart := time.Now()
-		if err := h.db.GetConn().PingContext(ctx); err != nil {
-			dbStatus = "unhealthy"
-		}
-		c.JSON(http.StatusOK, gin.H{"services": []ServiceInfo{
-			{Name: "postgres", Status: dbStatus, AvgResponseTime: float64(time.Since(dbStart).Milliseconds()), LastCheck: now},
-		}})
-		return
-	}
-
-	for _, ep := range serviceEndpoints {
-		if ep.Name == service {
-			c.JSON(http.StatusOK, gin.H{"services": []ServiceInfo{checkServiceHTTP(ctx, ep, now)}})
-			return
-		}
-	}
-
-	c.JSON(http.StatusNotFound, gin.H{"error": fmt.Sprintf("Unknown service: %s", service)})
+	c.JSON(http.StatusOK, gin.H{"services": []ServiceInfo{check(h, ctx, now)}})
 }
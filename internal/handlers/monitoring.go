@@ -3,7 +3,9 @@ package handlers
 import (
 	"context"
 	"database/sql"
+	"io"
 	"net/http"
+	"sync"
 	"time"
 
 	"github.com/gin-gonic/gin"
@@ -33,27 +35,6 @@ func (h *MonitoringHandler) GetServicesHealth(c *gin.Context) {
 	services := map[string]ServiceHealth{}
 	now := time.Now().Format(time.RFC3339)
 
-	// Check database
-	ctx, cancel := context.WithTimeout(context.Background(), 2*time.Second)
-	defer cancel()
-
-	start := time.Now()
-	if err := h.db.PingContext(ctx); err != nil {
-		services["postgres"] = ServiceHealth{
-			Status:    "unhealthy",
-			Port:      6432,
-			LastCheck: now,
-			Error:     err.Error(),
-		}
-	} else {
-		services["postgres"] = ServiceHealth{
-			Status:         "healthy",
-			Port:           6432,
-			LastCheck:      now,
-			ResponseTimeMs: float64(time.Since(start).Milliseconds()),
-		}
-	}
-
 	// Check other services via HTTP
 	checkHTTP := func(name, url string, port int) ServiceHealth {
 		start := time.Now()
@@ -61,7 +42,7 @@ func (h *MonitoringHandler) GetServicesHealth(c *gin.Context) {
 		defer cancel()
 
 		req, _ := http.NewRequestWithContext(ctx, "GET", url, nil)
-		resp, err := http.DefaultClient.Do(req)
+		resp, err := healthCheckClient.Do(req)
 
 		if err != nil {
 			return ServiceHealth{
@@ -72,6 +53,7 @@ func (h *MonitoringHandler) GetServicesHealth(c *gin.Context) {
 			}
 		}
 		defer resp.Body.Close()
+		io.Copy(io.Discard, io.LimitReader(resp.Body, healthCheckDrainLimit))
 
 		status := "unhealthy"
 		if resp.StatusCode >= 200 && resp.StatusCode < 300 {
@@ -95,17 +77,78 @@ func (h *MonitoringHandler) GetServicesHealth(c *gin.Context) {
 		LastCheck: now,
 	}
 
-	services["intraday-engine"] = checkHTTP("intraday-engine", "http://localhost:6007/health", 6007)
-	services["market-bridge"] = checkHTTP("market-bridge", "http://localhost:6005/health", 6005)
-	services["news-nlp"] = checkHTTP("news-nlp", "http://localhost:6006/health", 6006)
-	services["dashboard"] = checkHTTP("dashboard", "http://localhost:6003", 6003)
+	// Run every check concurrently so the response waits for the slowest
+	// one only; each has its own timeout so one slow check cannot use up
+	// another's
+	httpChecks := []struct {
+		name string
+		url  string
+		port int
+	}{
+		{"intraday-engine", "http://localhost:6007/health", 6007},
+		{"market-bridge", "http://localhost:6005/health", 6005},
+		{"news-nlp", "http://localhost:6006/health", 6006},
+		{"dashboard", "http://localhost:6003", 6003},
+	}
+	results := make([]ServiceHealth, len(httpChecks))
+	var dbHealth, natsHealth ServiceHealth
+	var wg sync.WaitGroup
+
+	// Check database
+	wg.Add(1)
+	go func() {
+		defer wg.Done()
+		ctx, cancel := context.WithTimeout(context.Background(), 2*time.Second)
+		defer cancel()
+
+		start := time.Now()
+		if err := h.db.PingContext(ctx); err != nil {
+			dbHealth = ServiceHealth{
+				Status:    "unhealthy",
+				Port:      6432,
+				LastCheck: now,
+				Error:     err.Error(),
+			}
+		} else {
+			dbHealth = ServiceHealth{
+				Status:         "healthy",
+				Port:           6432,
+				LastCheck:      now,
+				ResponseTimeMs: float64(time.Since(start).Milliseconds()),
+			}
+		}
+	}()
+
+	for i, hc := range httpChecks {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			results[i] = checkHTTP(hc.name, hc.url, hc.port)
+		}()
+	}
 
 	// NATS doesn't have HTTP endpoint by default, mark as healthy if we can connect
-	services["nats"] = ServiceHealth{
-		Status:    "healthy",
-		Port:      4222,
-		LastCheck: now,
+	wg.Add(1)
+	go func() {
+		defer wg.Done()
+		ctx, cancel := context.WithTimeout(context.Background(), 2*time.Second)
+		defer cancel()
+
+		natsHealth = ServiceHealth{Status: "healthy", Port: 4222, LastCheck: now}
+		if elapsed, err := probeTCP(ctx, natsAddr); err != nil {
+			natsHealth.Status = "unhealthy"
+			natsHealth.Error = err.Error()
+		} else {
+			natsHealth.ResponseTimeMs = float64(elapsed.Milliseconds())
+		}
+	}()
+	wg.Wait()
+
+	services["postgres"] = dbHealth
+	for i, hc := range httpChecks {
+		services[hc.name] = results[i]
 	}
+	services["nats"] = natsHealth
 
 	c.JSON(http.StatusOK, services)
 }
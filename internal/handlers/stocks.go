@@ -2,8 +2,13 @@ package handlers
 
 import (
 	"context"
+	"encoding/json"
+	"fmt"
+	"hash/fnv"
 	"net/http"
 	"strconv"
+	"strings"
+	"sync"
 	"time"
 
 	"github.com/gin-gonic/gin"
@@ -86,6 +91,52 @@ func (h *Handler) GetRealtimePrice(c *gin.Context) {
 	c.JSON(http.StatusOK, price)
 }
 
+// stockDataCacheControl lets browsers and CDNs reuse /api/stocks/:symbol for 30s
+const (
+	stockDataMaxAge       = 30 * time.Second
+	stockDataCacheControl = "public, max-age=30"
+)
+
+// stockETag is the last ETag issued for a symbol and how long it stays fresh
+type stockETag struct {
+	etag      string
+	expiresAt time.Time
+}
+
+// Last issued ETag per symbol, so conditional requests inside the max-age
+// window are answered with 304 without touching the database
+var (
+	stockETags   = map[string]stockETag{}
+	stockETagsMu sync.RWMutex
+)
+
+// etagMatches reports whether an If-None-Match header value matches etag. The
+// header is either "*" or a comma-separated list of entity tags; If-None-Match
+// uses weak comparison (RFC 9110), so a W/ prefix on a listed tag is ignored.
+func etagMatches(header, etag string) bool {
+	if strings.TrimSpace(header) == "*" {
+		return true
+	}
+	for {
+		header = strings.TrimLeft(header, " \t,")
+		if header == "" {
+			return false
+		}
+		header = strings.TrimPrefix(header, "W/")
+		if !strings.HasPrefix(header, `"`) {
+			return false
+		}
+		end := strings.IndexByte(header[1:], '"')
+		if end < 0 {
+			return false
+		}
+		if header[:end+2] == etag {
+			return true
+		}
+		header = header[end+2:]
+	}
+}
+
 // GetStockData handles GET /api/stocks/:symbol
 func (h *Handler) GetStockData(c *gin.Context) {
 	ctx, cancel := context.WithTimeout(context.Background(), 5*time.Second)
@@ -97,13 +148,47 @@ func (h *Handler) GetStockData(c *gin.Context) {
 		return
 	}
 
+	ifNoneMatch := c.GetHeader("If-None-Match")
+	if ifNoneMatch != "" {
+		stockETagsMu.RLock()
+		cached, ok := stockETags[symbol]
+		stockETagsMu.RUnlock()
+		if ok && etagMatches(ifNoneMatch, cached.etag) && time.Now().Before(cached.expiresAt) {
+			c.Header("ETag", cached.etag)
+			c.Header("Cache-Control", stockDataCacheControl)
+			c.Status(http.StatusNotModified)
+			return
+		}
+	}
+
 	stock, err := h.db.GetStockData(ctx, symbol)
 	if err != nil {
 		c.JSON(http.StatusNotFound, gin.H{"error": "Stock not found"})
 		return
 	}
 
-	c.JSON(http.StatusOK, stock)
+	body, err := json.Marshal(stock)
+	if err != nil {
+		c.JSON(http.StatusInternalServerError, gin.H{"error": "Failed to encode stock data"})
+		return
+	}
+
+	hash := fnv.New64a()
+	hash.Write(body)
+	etag := fmt.Sprintf(`"%016x"`, hash.Sum64())
+
+	stockETagsMu.Lock()
+	stockETags[symbol] = stockETag{etag: etag, expiresAt: time.Now().Add(stockDataMaxAge)}
+	stockETagsMu.Unlock()
+
+	c.Header("ETag", etag)
+	c.Header("Cache-Control", stockDataCacheControl)
+	if ifNoneMatch != "" && etagMatches(ifNoneMatch, etag) {
+		c.Status(http.StatusNotModified)
+		return
+	}
+
+	c.Data(http.StatusOK, "application/json; charset=utf-8", body)
 }
 
 // SearchStocks handles GET /api/stocks/search
@@ -3,7 +3,6 @@ package handlers
 import (
 	"database/sql"
 	"fmt"
-	"io/ioutil"
 	"log"
 	"net/http"
 	"os"
@@ -356,20 +355,26 @@ func (h *SystemHandler) GetMLModels(c *gin.Context) {
 	}
 
 	for _, dir := range mlDirs {
-		files, err := ioutil.ReadDir(dir)
+		// os.ReadDir reads only the directory entries; file metadata is
+		// fetched below for model files alone instead of for every file
+		entries, err := os.ReadDir(dir)
 		if err != nil {
 			continue
 		}
 
-		for _, file := range files {
-			if file.IsDir() {
+		for _, entry := range entries {
+			if entry.IsDir() {
 				continue
 			}
 
 			// Check for model files
-			name := file.Name()
+			name := entry.Name()
 			if strings.Contains(name, ".joblib") || strings.Contains(name, ".pkl") ||
 			   strings.Contains(name, ".pt") || strings.Contains(name, ".pth") {
+				file, err := entry.Info()
+				if err != nil {
+					continue
+				}
 
 				model := MLModel{
 					Name:      extractModelName(name),
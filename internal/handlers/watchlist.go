@@ -41,10 +41,20 @@ func (h *Handler) AddToWatchlist(c *gin.Context) {
 		return
 	}
 
+	// Check and insert under a single lock so concurrent adds of the same
+	// symbol agree on which one actually inserted it
 	watchlistMu.Lock()
-	watchlistStore[body.Symbol] = true
+	exists := watchlistStore[body.Symbol]
+	if !exists {
+		watchlistStore[body.Symbol] = true
+	}
 	watchlistMu.Unlock()
-	c.JSON(http.StatusOK, gin.H{"message": "Added to watchlist", "symbol": body.Symbol})
+
+	if exists {
+		c.JSON(http.StatusOK, gin.H{"message": "Already in watchlist", "symbol": body.Symbol, "added": false})
+		return
+	}
+	c.JSON(http.StatusOK, gin.H{"message": "Added to watchlist", "symbol": body.Symbol, "added": true})
 }
 
 // RemoveFromWatchlist handles DELETE /api/watchlist/:symbol
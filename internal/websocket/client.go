@@ -1,6 +1,7 @@
 package websocket
 
 import (
+	"io"
 	"log"
 	"time"
 
@@ -19,22 +20,109 @@ const (
 
 	// Maximum message size allowed from peer
 	maxMessageSize = 512
+
+	// Outbound messages buffered per client before the oldest is dropped
+	sendBufferSize = 256
+
+	// Priority messages buffered per client; a client that falls this far
+	// behind on them is evicted rather than losing one
+	prioritySendBufferSize = 16
+
+	// Consecutive full-buffer broadcasts after which a client is evicted
+	maxSendOverflows = 5
 )
 
+// newline separates messages batched into one WebSocket frame
+var newline = []byte{'\n'}
+
 // Client represents a WebSocket client connection
 type Client struct {
 	hub  *Hub
 	conn *websocket.Conn
 	send chan []byte
+
+	// Priority messages, written ahead of send and never dropped for room
+	priority chan []byte
+
+	// Hub shard the client is registered in and its slot there, set by the
+	// hub on register
+	shard *hubShard
+	index int
+
+	// Consecutive broadcasts that found the send buffer full, and whether
+	// the client was evicted; only touched by the fan-out for the client's
+	// shard
+	overflows int
+	evicted   bool
 }
 
 // NewClient creates a new WebSocket client
 func NewClient(hub *Hub, conn *websocket.Conn) *Client {
 	return &Client{
-		hub:  hub,
-		conn: conn,
-		send: make(chan []byte, 256),
+		hub:      hub,
+		conn:     conn,
+		send:     make(chan []byte, sendBufferSize),
+		priority: make(chan []byte, prioritySendBufferSize),
+		index:    -1,
+	}
+}
+
+// enqueue queues a message for the write pump without blocking. When the
+// send buffer is full the oldest queued message is dropped to make room, so
+// a slow reader loses stale updates instead of stalling the hub. Only the
+// fan-out for the client's shard sends on c.send, and Run waits for each
+// fan-out before starting the next, so the retry after dropping always has
+// space.
+// A client that stays full for maxSendOverflows broadcasts in a row is
+// disconnected; ReadPump then unregisters it.
+func (c *Client) enqueue(message []byte) {
+	select {
+	case c.send <- message:
+		c.overflows = 0
+		return
+	default:
+	}
+
+	c.overflows++
+	c.hub.dropped.Add(1)
+	if c.overflows == maxSendOverflows {
+		c.evict()
+	}
+
+	select {
+	case <-c.send:
+	default:
+	}
+
+	select {
+	case c.send <- message:
+	default:
+	}
+}
+
+// enqueuePriority queues a priority message on its own buffer, which
+// WritePump drains before c.send, so broadcasts can never displace it. A
+// client whose priority buffer is full is evicted instead of losing the
+// message silently.
+func (c *Client) enqueuePriority(message []byte) {
+	select {
+	case c.priority <- message:
+	default:
+		c.hub.dropped.Add(1)
+		c.evict()
+	}
+}
+
+// evict disconnects a client that cannot keep up; ReadPump then unregisters
+// it
+func (c *Client) evict() {
+	if c.evicted {
+		return
 	}
+	c.evicted = true
+	c.hub.slow.Add(1)
+	log.Printf("⚠️  Evicting slow WebSocket client %s", c.conn.RemoteAddr())
+	c.conn.Close()
 }
 
 // ReadPump pumps messages from the WebSocket connection to the hub
@@ -51,7 +139,12 @@ func (c *Client) ReadPump() {
 	})
 
 	for {
-		_, _, err := c.conn.ReadMessage()
+		// Inbound payloads are not used, so drain each frame straight into
+		// io.Discard rather than buffering it into a fresh slice like ReadMessage
+		_, r, err := c.conn.NextReader()
+		if err == nil {
+			_, err = io.Copy(io.Discard, r)
+		}
 		if err != nil {
 			if websocket.IsUnexpectedCloseError(err, websocket.CloseGoingAway, websocket.CloseAbnormalClosure) {
 				log.Printf("WebSocket error: %v", err)
@@ -70,33 +163,37 @@ func (c *Client) WritePump() {
 	}()
 
 	for {
+		// Write queued priority messages first; select alone picks randomly
+		// among ready channels
 		select {
-		case message, ok := <-c.send:
-			c.conn.SetWriteDeadline(time.Now().Add(writeWait))
-			if !ok {
-				// Hub closed the channel
-				c.conn.WriteMessage(websocket.CloseMessage, []byte{})
+		case message := <-c.priority:
+			if !c.writeBatch(message, c.priority) {
 				return
 			}
+			continue
+		default:
+		}
 
-			w, err := c.conn.NextWriter(websocket.TextMessage)
-			if err != nil {
+		select {
+		case message := <-c.priority:
+			if !c.writeBatch(message, c.priority) {
 				return
 			}
-			w.Write(message)
 
-			// Add queued messages to current WebSocket message
-			n := len(c.send)
-			for i := 0; i < n; i++ {
-				w.Write([]byte{'\n'})
-				w.Write(<-c.send)
+		case message, ok := <-c.send:
+			if !ok {
+				// Hub closed the channel
+				c.conn.SetWriteDeadline(time.Now().Add(writeWait))
+				c.conn.WriteMessage(websocket.CloseMessage, []byte{})
+				return
 			}
-
-			if err := w.Close(); err != nil {
+			if !c.writeBatch(message, c.send) {
 				return
 			}
 
 		case <-ticker.C:
+			// Pings are sent even to busy clients: ReadPump's read deadline
+			// is only extended by pongs, and clients send nothing else
 			c.conn.SetWriteDeadline(time.Now().Add(writeWait))
 			if err := c.conn.WriteMessage(websocket.PingMessage, nil); err != nil {
 				return
@@ -104,3 +201,24 @@ func (c *Client) WritePump() {
 		}
 	}
 }
+
+// writeBatch writes first and any messages already waiting on queue as one
+// newline-separated WebSocket frame. It reports false if the connection
+// failed.
+func (c *Client) writeBatch(first []byte, queue chan []byte) bool {
+	c.conn.SetWriteDeadline(time.Now().Add(writeWait))
+	w, err := c.conn.NextWriter(websocket.TextMessage)
+	if err != nil {
+		return false
+	}
+	w.Write(first)
+
+	// Add queued messages to current WebSocket message
+	n := len(queue)
+	for i := 0; i < n; i++ {
+		w.Write(newline)
+		w.Write(<-queue)
+	}
+
+	return w.Close() == nil
+}
@@ -1,90 +1,252 @@
 package websocket
 
 import (
-	"encoding/json"
+	"errors"
 	"log"
+	"runtime"
 	"sync"
+	"sync/atomic"
+
+	json "github.com/goccy/go-json"
 )
 
+// maxBroadcastBatch caps how many queued broadcasts are coalesced into a
+// single payload per fan-out
+const maxBroadcastBatch = 64
+
+// broadcastQueueSize is how many broadcasts may wait for the hub before
+// Broadcast starts dropping them
+const broadcastQueueSize = 4096
+
+// parallelFanOutMinClients is the client count below which a broadcast is
+// fanned out on the hub goroutine; for fewer clients the per-shard
+// goroutines cost more than the enqueues they spread out
+const parallelFanOutMinClients = 256
+
+// ErrBroadcastQueueFull is returned by Broadcast when the message was dropped
+var ErrBroadcastQueueFull = errors.New("websocket: broadcast queue full")
+
+// hubShard holds one partition of the registered clients. Its client slice
+// needs no lock: add, remove and fanOut all run on the Run goroutine, which
+// waits for every shard's fan-out before touching a shard again.
+type hubShard struct {
+	// Clients stored densely; each client's index field is its slot
+	clients []*Client
+}
+
+// add appends client to the shard
+func (s *hubShard) add(client *Client) {
+	client.index = len(s.clients)
+	s.clients = append(s.clients, client)
+}
+
+// remove drops client by moving the last client into its slot. It reports
+// false if the client was already removed.
+func (s *hubShard) remove(client *Client) bool {
+	i := client.index
+	if i < 0 || i >= len(s.clients) || s.clients[i] != client {
+		return false
+	}
+	last := len(s.clients) - 1
+	s.clients[i] = s.clients[last]
+	s.clients[i].index = i
+	s.clients[last] = nil
+	s.clients = s.clients[:last]
+	client.index = -1
+	return true
+}
+
+// fanOut queues message for every client in the shard, on the priority
+// buffer when priority is set
+func (s *hubShard) fanOut(message []byte, priority bool) {
+	for _, client := range s.clients {
+		if priority {
+			client.enqueuePriority(message)
+		} else {
+			client.enqueue(message)
+		}
+	}
+}
+
 // Hub maintains active WebSocket connections and broadcasts messages
 type Hub struct {
-	// Registered clients
-	clients map[*Client]bool
+	// Registered clients, partitioned so broadcasts fan out in parallel
+	shards []*hubShard
+
+	// Shard the next registered client is assigned to
+	nextShard int
 
 	// Inbound messages from clients
 	broadcast chan []byte
 
+	// Latency-sensitive messages, fanned out ahead of queued broadcasts
+	// and never coalesced
+	priority chan []byte
+
 	// Register requests from clients
 	register chan *Client
 
 	// Unregister requests from clients
 	unregister chan *Client
 
-	// Mutex for thread-safe operations
-	mu sync.RWMutex
+	// Live number of registered clients, read without locking
+	count atomic.Int64
+
+	// Messages dropped from the broadcast queue or full client buffers, and
+	// clients evicted for staying full
+	dropped atomic.Int64
+	slow    atomic.Int64
+}
+
+// HubStats reports hub backpressure counters
+type HubStats struct {
+	Clients         int64 `json:"clients"`
+	DroppedMessages int64 `json:"dropped_messages"`
+	SlowClients     int64 `json:"slow_clients"`
 }
 
 // NewHub creates a new WebSocket hub
 func NewHub() *Hub {
+	shards := make([]*hubShard, runtime.GOMAXPROCS(0))
+	for i := range shards {
+		shards[i] = &hubShard{}
+	}
+
 	return &Hub{
-		broadcast:  make(chan []byte, 256),
+		broadcast:  make(chan []byte, broadcastQueueSize),
+		priority:   make(chan []byte, 64),
 		register:   make(chan *Client),
 		unregister: make(chan *Client),
-		clients:    make(map[*Client]bool),
+		shards:     shards,
 	}
 }
 
 // Run starts the hub's main loop
 func (h *Hub) Run() {
 	for {
+		// Drain priority messages first; select alone picks randomly among
+		// ready channels and would leave them behind a burst of broadcasts
+		select {
+		case message := <-h.priority:
+			h.fanOut(message, true)
+			continue
+		default:
+		}
+
 		select {
+		case message := <-h.priority:
+			h.fanOut(message, true)
+
 		case client := <-h.register:
-			h.mu.Lock()
-			h.clients[client] = true
-			h.mu.Unlock()
-			log.Printf("✅ WebSocket client connected (total: %d)", len(h.clients))
+			client.shard = h.shards[h.nextShard]
+			h.nextShard = (h.nextShard + 1) % len(h.shards)
+			client.shard.add(client)
+			log.Printf("✅ WebSocket client connected (total: %d)", h.count.Add(1))
 
 		case client := <-h.unregister:
-			h.mu.Lock()
-			if _, ok := h.clients[client]; ok {
-				delete(h.clients, client)
+			if client.shard.remove(client) {
 				close(client.send)
+				h.count.Add(-1)
 			}
-			h.mu.Unlock()
-			log.Printf("👋 WebSocket client disconnected (total: %d)", len(h.clients))
+			log.Printf("👋 WebSocket client disconnected (total: %d)", h.count.Load())
 
 		case message := <-h.broadcast:
-			h.mu.Lock()
-			for client := range h.clients {
-				select {
-				case client.send <- message:
-				default:
-					// Client's send channel is full, remove it
-					delete(h.clients, client)
-					close(client.send)
-				}
-			}
-			h.mu.Unlock()
+			h.fanOut(h.coalesceBroadcasts(message), false)
 		}
 	}
 }
 
-// Broadcast sends a message to all connected clients
+// fanOut delivers message to every non-empty shard, concurrently once there
+// are enough clients, and waits for all of them, so broadcasts still reach
+// each client in order
+func (h *Hub) fanOut(message []byte, priority bool) {
+	if len(h.shards) == 1 || h.count.Load() < parallelFanOutMinClients {
+		for _, shard := range h.shards {
+			shard.fanOut(message, priority)
+		}
+		return
+	}
+
+	var wg sync.WaitGroup
+	for _, shard := range h.shards {
+		if len(shard.clients) == 0 {
+			continue
+		}
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			shard.fanOut(message, priority)
+		}()
+	}
+	wg.Wait()
+}
+
+// coalesceBroadcasts joins broadcasts already waiting on the channel onto
+// first, newline-separated like WritePump's own batching, so a burst is fanned
+// out to every client once instead of once per message. Only Run receives from
+// h.broadcast, so the pending count cannot shrink underneath it.
+func (h *Hub) coalesceBroadcasts(first []byte) []byte {
+	pending := len(h.broadcast)
+	if pending == 0 {
+		return first
+	}
+	if pending > maxBroadcastBatch-1 {
+		pending = maxBroadcastBatch - 1
+	}
+
+	batch := make([]byte, 0, len(first)*(pending+1))
+	batch = append(batch, first...)
+	for i := 0; i < pending; i++ {
+		batch = append(batch, '\n')
+		batch = append(batch, <-h.broadcast...)
+	}
+	return batch
+}
+
+// Broadcast queues a message for all connected clients without blocking the
+// caller. If the hub is too far behind to take it, the message is dropped and
+// ErrBroadcastQueueFull is returned.
 func (h *Hub) Broadcast(data interface{}) error {
 	message, err := json.Marshal(data)
 	if err != nil {
 		return err
 	}
 
-	h.broadcast <- message
+	select {
+	case h.broadcast <- message:
+		return nil
+	default:
+		h.dropped.Add(1)
+		return ErrBroadcastQueueFull
+	}
+}
+
+// BroadcastPriority sends a message to all connected clients ahead of any
+// queued Broadcast messages. Unlike Broadcast it waits for room rather than
+// dropping the message, and each client gets it on a separate buffer that
+// broadcasts cannot displace; a client too far behind to take it is evicted.
+func (h *Hub) BroadcastPriority(data interface{}) error {
+	message, err := json.Marshal(data)
+	if err != nil {
+		return err
+	}
+
+	h.priority <- message
 	return nil
 }
 
 // ClientCount returns the number of connected clients
 func (h *Hub) ClientCount() int {
-	h.mu.RLock()
-	defer h.mu.RUnlock()
-	return len(h.clients)
+	return int(h.count.Load())
+}
+
+// Stats returns the current client count and backpressure counters
+func (h *Hub) Stats() HubStats {
+	return HubStats{
+		Clients:         h.count.Load(),
+		DroppedMessages: h.dropped.Load(),
+		SlowClients:     h.slow.Load(),
+	}
 }
 
 // Register registers a new client